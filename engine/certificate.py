@@ -5,103 +5,220 @@ Generates achievement certificates for completing K8sQuest worlds
 """
 
 import sys
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-def generate_certificate(world_num, player_name, total_xp):
-    """Generate a completion certificate for a world"""
-    
-    world_info = {
-        1: {
-            "name": "Core Kubernetes Basics",
-            "levels": 10,
-            "skills": [
-                "Debug CrashLoopBackOff errors",
-                "Fix ImagePullBackOff issues",
-                "Resolve Pending pod problems",
-                "Work with label selectors",
-                "Debug port mismatches",
-                "Manage multi-container pods",
-                "Navigate container logs",
-                "Understand init containers",
-                "Work with namespaces",
-                "Handle resource quotas"
-            ]
-        },
-        2: {
-            "name": "Deployments & Scaling",
-            "levels": 10,
-            "skills": [
-                "Rollback failed deployments",
-                "Configure liveness probes",
-                "Configure readiness probes",
-                "Set up HorizontalPodAutoscaler",
-                "Optimize rollout strategies",
-                "Work with PodDisruptionBudgets",
-                "Implement blue-green deployments",
-                "Implement canary deployments",
-                "Choose StatefulSet vs Deployment",
-                "Understand ReplicaSet management"
-            ]
-        }
+# Output directory, resolved once; mkdir only runs on the first save
+_CERT_DIR = Path(__file__).resolve().parent.parent / "certificates"
+_dir_ready = False
+
+# (date, formatted string) for the last day a certificate was generated
+_date_cache = None
+
+# World metadata shown on completion certificates
+_WORLD_INFO = {
+    1: {
+        "name": "Core Kubernetes Basics",
+        "levels": 10,
+        "skills": (
+            "Debug CrashLoopBackOff errors",
+            "Fix ImagePullBackOff issues",
+            "Resolve Pending pod problems",
+            "Work with label selectors",
+            "Debug port mismatches",
+            "Manage multi-container pods",
+            "Navigate container logs",
+            "Understand init containers",
+            "Work with namespaces",
+            "Handle resource quotas"
+        )
+    },
+    2: {
+        "name": "Deployments & Scaling",
+        "levels": 10,
+        "skills": (
+            "Rollback failed deployments",
+            "Configure liveness probes",
+            "Configure readiness probes",
+            "Set up HorizontalPodAutoscaler",
+            "Optimize rollout strategies",
+            "Work with PodDisruptionBudgets",
+            "Implement blue-green deployments",
+            "Implement canary deployments",
+            "Choose StatefulSet vs Deployment",
+            "Understand ReplicaSet management"
+        )
     }
-    
-    if world_num not in world_info:
-        print(f"❌ World {world_num} not found")
-        return
-    
-    world = world_info[world_num]
-    date = datetime.now().strftime("%B %d, %Y")
-    
-    certificate = f"""
+}
+
+
+# Numbered skill lines per world, formatted once at import
+_SKILL_LINES = {
+    num: tuple(f"   {i:2d}. {skill}\n" for i, skill in enumerate(world['skills'], 1))
+    for num, world in _WORLD_INFO.items()
+}
+
+# "Next:" teaser line shown after each world
+_NEXT_WORLD = {
+    1: "Next: World 2 - Deployments & Scaling\n",
+    2: "Next: World 3 - Networking & Services\n",
+}
+
+# Static certificate layout around the skill lines; only the fields in
+# braces vary per call
+_CERTIFICATE_HEAD = """
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║              🏆 WORLD {world_num} COMPLETE! 🏆                      ║
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
 
-Player: {player_name}
-World: {world_info[world_num]['name']}
+Player: {player}
+World: {name}
 Date: {date}
 
 📊 Achievement:
-   • {world['levels']} Levels Completed
+   • {levels} Levels Completed
    • {total_xp} XP Earned
 
 🎯 Skills Mastered:
 """
+_CERTIFICATE_FOOT = """
+{next}
+🎮 Keep learning, keep fixing Kubernetes! 🎮
+
+"""
+
+# Divider between certificates in a combined archive file
+_ARCHIVE_SEPARATOR = "\n" + "=" * 65 + "\n"
+
+
+def _world_exists(world_num):
+    """Check a world has certificate data, reporting unknown worlds"""
+    if world_num not in _WORLD_INFO:
+        print(f"❌ World {world_num} not found")
+        return False
+    return True
+
+
+def generate_certificate(world_num, player_name, total_xp):
+    """Generate a completion certificate for a world"""
     
-    for i, skill in enumerate(world['skills'], 1):
-        certificate += f"   {i:2d}. {skill}\n"
+    if not _world_exists(world_num):
+        return
     
-    certificate += "\n"
+    return _render_certificate(world_num, player_name, total_xp, _today())
+
+
+def generate_certificate_to(sink, world_num, player_name, total_xp):
+    """Write a completion certificate to a file-like sink
     
-    if world_num == 1:
-        certificate += "Next: World 2 - Deployments & Scaling\n"
-    elif world_num == 2:
-        certificate += "Next: World 3 - Networking & Services\n"
+    Returns:
+        True if a certificate was written, False for an unknown world
+    """
+    if not _world_exists(world_num):
+        return False
     
-    certificate += """
-🎮 Keep learning, keep fixing Kubernetes! 🎮
+    # One write per section, so the full text is never built in memory
+    for section in _certificate_sections(world_num, player_name, total_xp, _today()):
+        sink.write(section)
+    return True
 
-"""
+
+def _today():
+    """Return today's date formatted for certificates, reformatting only when the day changes"""
+    global _date_cache
+    today = date.today()
+    if _date_cache is None or _date_cache[0] != today:
+        _date_cache = (today, today.strftime("%B %d, %Y"))
+    return _date_cache[1]
+
+
+def _certificate_sections(world_num, player_name, total_xp, date_str):
+    """Yield the certificate text in order: header, one line per skill, footer"""
+    world = _WORLD_INFO[world_num]
     
-    return certificate
+    yield _CERTIFICATE_HEAD.format_map({
+        "world_num": world_num,
+        "player": player_name,
+        "name": world['name'],
+        "date": date_str,
+        "levels": world['levels'],
+        "total_xp": total_xp,
+    })
+    yield from _SKILL_LINES[world_num]
+    yield _CERTIFICATE_FOOT.format_map({"next": _NEXT_WORLD.get(world_num, "")})
+
+
+@lru_cache(maxsize=128)
+def _render_certificate(world_num, player_name, total_xp, date_str):
+    """Render the certificate text (cached - the date is passed in so it never goes stale)"""
+    return "".join(_certificate_sections(world_num, player_name, total_xp, date_str))
+
+
+def _ensure_cert_dir():
+    """Create the certificates directory once per process"""
+    global _dir_ready
+    if not _dir_ready:
+        _CERT_DIR.mkdir(exist_ok=True)
+        _dir_ready = True
+    return _CERT_DIR
+
+
+def _certificate_path(world_num):
+    """Path of the certificate file for a world"""
+    return _ensure_cert_dir() / f"world-{world_num}-completion.txt"
 
 
 def save_certificate(world_num, certificate):
     """Save certificate to file"""
-    cert_dir = Path(__file__).parent.parent / "certificates"
-    cert_dir.mkdir(exist_ok=True)
-    
-    cert_file = cert_dir / f"world-{world_num}-completion.txt"
+    cert_file = _certificate_path(world_num)
     
-    with open(cert_file, 'w', encoding='utf-8') as f:
-        f.write(certificate)
+    cert_file.write_text(certificate, encoding='utf-8')
     
     return cert_file
 
 
+def save_certificates(items, archive_name=None):
+    """Save several certificates in one call
+    
+    Args:
+        items: Iterable of (world_num, certificate) pairs
+        archive_name: If set, write every certificate into this single file
+                      instead of one file per world
+    
+    Returns:
+        List of the files written
+    """
+    if archive_name:
+        archive_file = _ensure_cert_dir() / archive_name
+        archive_file.write_text(
+            _ARCHIVE_SEPARATOR.join(certificate for _, certificate in items),
+            encoding='utf-8',
+        )
+        return [archive_file]
+    
+    cert_files = []
+    for world_num, certificate in items:
+        cert_file = _certificate_path(world_num)
+        cert_file.write_text(certificate, encoding='utf-8')
+        cert_files.append(cert_file)
+    return cert_files
+
+
+class _Tee:
+    """Minimal file-like object that forwards writes to several sinks"""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def write(self, text):
+        for sink in self.sinks:
+            sink.write(text)
+        return len(text)
+
+
 def main():
     if len(sys.argv) < 4:
         print("Usage: python3 certificate.py <world_num> <player_name> <total_xp>")
@@ -112,17 +229,19 @@ def main():
     player_name = sys.argv[2]
     total_xp = int(sys.argv[3])
     
-    certificate = generate_certificate(world_num, player_name, total_xp)
+    if not _world_exists(world_num):
+        return
+    
+    # Stream the certificate to the console and the file in one pass
+    cert_file = _certificate_path(world_num)
+    with open(cert_file, 'w', encoding='utf-8') as f:
+        generate_certificate_to(_Tee(sys.stdout, f), world_num, player_name, total_xp)
     
-    if certificate:
-        # Print to console
-        print(certificate)
-        
-        # Save to file
-        cert_file = save_certificate(world_num, certificate)
-        print(f"✅ Certificate saved to: {cert_file}")
-        print("")
-        print("🎉 Congratulations on completing this world!")
+    sys.stdout.write(
+        f"✅ Certificate saved to: {cert_file}\n"
+        "\n"
+        "🎉 Congratulations on completing this world!\n"
+    )
 
 
 if __name__ == "__main__":
@@ -4,22 +4,25 @@ K8sQuest - Interactive Kubernetes Learning Game
 🎮 Now with Retro Gaming UI! 🎮
 """
 
+import atexit
 import json
 import os
+import queue
+import re
 import select
+import shlex
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
 from rich import box
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 from rich.text import Text
@@ -70,8 +73,452 @@ except ImportError:
     SAFETY_ENABLED = False
     print("⚠️  Warning: Safety guards module not found. Running without protection.")
 
+# Optional faster JSON serializer for progress saves. Autosaves are compact;
+# the final save on exit is indented for anyone reading progress.json
+try:
+    import orjson
+
+    def _dump_progress(progress, pretty=False):
+        return orjson.dumps(progress, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+except ImportError:
+
+    def _dump_progress(progress, pretty=False):
+        if pretty:
+            return json.dumps(progress, indent=2).encode("utf-8")
+        return json.dumps(progress, separators=(",", ":")).encode("utf-8")
+
+
 console = Console()
 
+# yaml, http.client, rich.markdown, rich.live and rich.progress are imported
+# inside the functions that need them to keep startup fast
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """Prefer the libyaml-backed C loader; fall back to the pure-Python parser"""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Mission namespace, applied together with each level's broken.yaml
+_NAMESPACE_MANIFEST = """apiVersion: v1
+kind: Namespace
+metadata:
+  name: k8squest
+"""
+
+# All 5 worlds in play order
+_ALL_WORLDS = (
+    "world-1-basics",
+    "world-2-deployments",
+    "world-3-networking",
+    "world-4-storage",
+    "world-5-security",
+)
+_WORLD_INDEX = {world: i for i, world in enumerate(_ALL_WORLDS)}
+# Menu headings, e.g. "world-1-basics" -> "World 1 Basics"
+_WORLD_DISPLAY = {
+    world: world.replace("world-", "World ").replace("-", " ").title()
+    for world in _ALL_WORLDS
+}
+
+# Minimum seconds between throttled resume-point saves
+_PROGRESS_SAVE_INTERVAL = 5.0
+
+# Status rows kept on screen while monitoring
+_MONITOR_ROWS = 10
+
+# Retro-style title for the welcome screen
+_TITLE_ART = """
+    ╦╔═╔═╗╔═╗ ╦ ╦╔═╗╔═╗╔╦╗
+    ╠╩╗╚═╗║═╬╗║ ║║╣ ╚═╗ ║
+    ╩ ╩╚═╝╚═╝╚╚═╝╚═╝╚═╝ ╩
+        """
+
+# Every 20-cell welcome progress bar, indexed by filled cells
+_PROGRESS_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Static welcome-screen panels; only the player stats change between calls
+_WELCOME_PANEL = Panel(
+    Text(_TITLE_ART, style="bold cyan")
+    + Text("\n🎮 Kubernetes Adventure Game 🎮\n", style="bold yellow")
+    + Text("Contra-Style Learning | Arcade Action | Boss Battles", style="dim"),
+    title="[bold magenta]⚔️  K8SQUEST  ⚔️[/bold magenta]",
+    border_style="cyan",
+    box=box.HEAVY,
+)
+
+_SAFETY_PANEL = Panel(
+    "[green]🛡️  DEFENSE SYSTEMS ONLINE[/green]\n"
+    "[dim]✓ Prevents cluster destruction\n"
+    "✓ Namespace protection active\n"
+    "✓ Safe mode engaged\n"
+    "Type 'safety info' for shield details[/dim]",
+    border_style="green",
+    box=box.HEAVY,
+    title="[bold green]🔰 SAFETY PROTOCOLS[/bold green]",
+)
+
+# Level picker heading, reused on every redraw
+_SELECT_LEVEL_PANEL = Panel("[bold cyan]Select a Level to Play[/bold cyan]", border_style="cyan")
+
+
+@lru_cache(maxsize=256)
+def _read_text(path_str, mtime_ns, size):
+    """Read a text file; cached per (path, mtime, size) so edited files are re-read"""
+    return Path(path_str).read_text(encoding='utf-8', errors='replace')
+
+
+_HINT_FILE_RE = re.compile(r"hint-([1-3])\.txt")
+
+
+_SPLIT_NUMBERS = re.compile(r"(\d+)").split
+
+
+def _natural_sort_key(path):
+    """Sort key that orders level-2 before level-10"""
+    return [int(part) if part.isdigit() else part for part in _SPLIT_NUMBERS(path.name)]
+
+
+@lru_cache(maxsize=64)
+def _markdown(text):
+    """Parse Markdown once per distinct text; revisited guides and debrief pages reuse it"""
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+def _level_dirs(world_path):
+    """A world's level-* directories in natural order
+
+    os.scandir reports entry types from the directory read itself, so this
+    avoids a stat() per entry; the name check runs first and skips even that
+    for stray files.
+    """
+    with os.scandir(world_path) as entries:
+        dirs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("level-") and entry.is_dir(follow_symlinks=False)
+        ]
+    return sorted(dirs, key=_natural_sort_key)
+
+
+@lru_cache(maxsize=64)
+def _hint_files(level_path_str, mtime_ns):
+    """List a level's (number, path) hint files with one directory scan
+
+    Keyed on the directory mtime, so adding or removing hints invalidates it.
+    """
+    hints = []
+    with os.scandir(level_path_str) as entries:
+        for entry in entries:
+            match = _HINT_FILE_RE.fullmatch(entry.name)
+            if match and entry.is_file():
+                hints.append((int(match.group(1)), Path(entry.path)))
+    return tuple(sorted(hints))
+
+
+def _read_level_file(path):
+    """Read a level file (hints, debrief, solution, mission) through the session cache"""
+    stat = path.stat()
+    return _read_text(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _level_key(level_path):
+    """Bundle key for a level - 'world/level', since level names can repeat across worlds"""
+    return f"{level_path.parent.name}/{level_path.name}"
+
+
+# Files bundled per level into .levels_cache.json
+_LEVEL_FILES = frozenset(
+    ("mission.yaml", "hint-1.txt", "hint-2.txt", "hint-3.txt", "debrief.md", "solution.yaml")
+)
+
+
+def _levels_fingerprint(worlds_dir):
+    """Return a hash of (path, mtime, size) over every level file
+
+    Costs one stat per file rather than six opens per level, and changes
+    whenever a level file is edited, added, removed or swapped for another
+    copy that kept its old mtime (cp -p, rsync -t, tar x).
+    """
+    import hashlib
+
+    stamps = []
+    with os.scandir(worlds_dir) as worlds:
+        for world in worlds:
+            if not world.is_dir():
+                continue
+            with os.scandir(world.path) as levels:
+                for level in levels:
+                    if not level.is_dir():
+                        continue
+                    with os.scandir(level.path) as files:
+                        for entry in files:
+                            if entry.name in _LEVEL_FILES:
+                                stat = entry.stat()
+                                stamps.append((
+                                    f"{world.name}/{level.name}/{entry.name}",
+                                    stat.st_mtime_ns,
+                                    stat.st_size,
+                                ))
+    stamps.sort()
+    return hashlib.sha1(repr(stamps).encode("utf-8")).hexdigest()
+
+
+def _pod_status(pod):
+    """Summarize a pod like kubectl's READY/STATUS columns, e.g. '0/1 CrashLoopBackOff'"""
+    containers = pod.get("spec", {}).get("containers", [])
+    statuses = pod.get("status", {}).get("containerStatuses", [])
+    ready = sum(1 for cs in statuses if cs.get("ready"))
+
+    reason = pod.get("status", {}).get("phase", "?")
+    for cs in statuses:
+        waiting = cs.get("state", {}).get("waiting")
+        if waiting and waiting.get("reason"):
+            reason = waiting["reason"]
+            break
+
+    return f"{ready}/{len(containers)} {reason}"
+
+
+def _ingress_hosts(ingress):
+    """Comma-separated hosts of an ingress's rules, or '*' when none are set"""
+    rules = ingress.get("spec", {}).get("rules", [])
+    return ",".join(rule["host"] for rule in rules if rule.get("host")) or "*"
+
+
+# One-line status formatter per resource kind, indexed by the item's kind
+_KIND_FMT = {
+    "Pod": lambda i: f"Pod {i['metadata']['name']}: {_pod_status(i)}",
+    "Deployment": lambda i: (
+        f"Deploy {i['metadata']['name']}: "
+        f"{i.get('status', {}).get('readyReplicas', 0)}/{i.get('spec', {}).get('replicas', 0)}"
+    ),
+    "Service": lambda i: f"Svc {i['metadata']['name']}: {i.get('spec', {}).get('type', '?')}",
+    "Ingress": lambda i: f"Ingress {i['metadata']['name']}: {_ingress_hosts(i)}",
+    "PersistentVolumeClaim": lambda i: (
+        f"PVC {i['metadata']['name']}: {i.get('status', {}).get('phase', '?')}"
+    ),
+    "ConfigMap": lambda i: f"CM {i['metadata']['name']}",
+}
+
+
+# Namespaced list endpoints polled for the status monitor, in display order.
+# List responses omit each item's kind, so it is recorded alongside the path.
+_RESOURCE_ENDPOINTS = (
+    ("Pod", "/api/v1/namespaces/k8squest/pods"),
+    ("Deployment", "/apis/apps/v1/namespaces/k8squest/deployments"),
+    ("Service", "/api/v1/namespaces/k8squest/services"),
+    ("Ingress", "/apis/networking.k8s.io/v1/namespaces/k8squest/ingresses"),
+    ("PersistentVolumeClaim", "/api/v1/namespaces/k8squest/persistentvolumeclaims"),
+    ("ConfigMap", "/api/v1/namespaces/k8squest/configmaps"),
+)
+
+
+class KubeProxy:
+    """Session-long `kubectl proxy` reached over one keep-alive HTTP connection
+
+    Starting kubectl once avoids re-loading kubeconfig and re-doing the TLS
+    handshake on every status poll. All methods fail soft (returning None)
+    so callers can fall back to plain kubectl.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._failed = False
+        self.port = None
+        atexit.register(self.stop)  # Once per proxy, however often it restarts
+
+    def start(self):
+        """Start the proxy on a free port if it isn't already running"""
+        if self._process and self._process.poll() is None:
+            return True
+        if self._failed:
+            return False
+
+        try:
+            self._process = subprocess.Popen(
+                # Only GETs are ever sent, so refuse anything that writes
+                ["kubectl", "proxy", "--port=0", "--reject-methods=^(POST|PUT|PATCH|DELETE)$"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            self._failed = True
+            return False
+
+        # First line is "Starting to serve on 127.0.0.1:<port>"
+        match = re.search(r":(\d+)\s*$", self._process.stdout.readline())
+        if not match:
+            self.stop()
+            self._failed = True
+            return False
+
+        self.port = int(match.group(1))
+        self._conn = None
+        return True
+
+    def get_json(self, path, timeout=3):
+        """GET an API path through the proxy
+
+        Returns the decoded JSON body, {} for a 404 (e.g. a missing object or
+        an API group the cluster doesn't serve), or None if the proxy is
+        unreachable or answers with any other error.
+        """
+        if not self.start():
+            return None
+
+        import http.client
+
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=timeout)
+
+        try:
+            self._conn.request("GET", path)
+            response = self._conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            self._conn.close()
+            self._conn = None
+            return None
+
+        if response.status == 404:
+            return {}
+        if response.status != 200:
+            return None  # 403, or 502/503 when the API server is down
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def stop(self):
+        """Close the connection and terminate the proxy process"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+
+class BashSession:
+    """A long-lived bash that runs validate.sh scripts one after another
+
+    Spares a fresh bash start-up on every validate attempt. Each script runs
+    in its own subshell with stdin from /dev/null, so `exit`, `cd` and
+    `set -e` inside it never reach the session.
+    """
+
+    # run() result when bash died before the script finished; real exit
+    # statuses are 0-255
+    ABORTED = -1
+
+    def __init__(self):
+        self._process = None
+        self._failed = False
+        # Printed after each script with its exit status appended
+        self._marker = f"__k8squest_done_{os.urandom(8).hex()}__"
+        atexit.register(self.stop)  # Once per session, however often bash restarts
+
+    def start(self):
+        """Start bash if it isn't already running"""
+        if self._process and self._process.poll() is None:
+            return True
+        if self._failed:
+            return False
+
+        try:
+            self._process = subprocess.Popen(
+                ["bash"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except OSError:
+            self._failed = True
+            return False
+
+        return True
+
+    def run(self, cwd, script_name, on_line):
+        """Source cwd/script_name, passing each output line to on_line
+
+        Returns the script's exit status, ABORTED if bash died mid-script, or
+        None if bash is unavailable.
+        """
+        if not self.start():
+            return None
+
+        command = (
+            f"( cd {shlex.quote(str(Path(cwd).resolve()))} && source ./{shlex.quote(script_name)} )"
+            f" < /dev/null 2>&1; printf '{self._marker}%s\\n' \"$?\"\n"
+        )
+        try:
+            self._process.stdin.write(command)
+            self._process.stdin.flush()
+        except OSError:
+            self.stop()
+            return None
+
+        for line in self._process.stdout:
+            index = line.find(self._marker)
+            if index < 0:
+                on_line(line)
+                continue
+            # Output without a trailing newline shares the marker's line
+            if index:
+                on_line(line[:index])
+            return int(line[index + len(self._marker):])
+
+        self.stop()  # bash died mid-script; the next run() restarts it
+        return self.ABORTED
+
+    def stop(self):
+        """Terminate the bash process"""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+
+def _lookup_field(obj, dotted_path):
+    """Follow a dotted path like 'status.containerStatuses.0.ready' into an object"""
+    for key in dotted_path.split("."):
+        if isinstance(obj, list):
+            try:
+                obj = obj[int(key)]
+            except (ValueError, IndexError):
+                return None
+        elif isinstance(obj, dict):
+            obj = obj.get(key)
+        else:
+            return None
+    return obj
+
+
+def _pump_lines(stream, sink):
+    """Forward lines from a subprocess stream into a queue, then None at EOF"""
+    for line in stream:
+        sink.put(line)
+    sink.put(None)
+
 
 class PaginatedDisplay:
     """Helper class for paginating long content like man pages"""
@@ -173,7 +620,7 @@ class PaginatedDisplay:
 
         self.console.print(
             Panel(
-                Markdown(page_content),
+                _markdown(page_content),
                 title=f"[bold {border_style}]{title}{page_indicator}[/bold {border_style}]",
                 border_style=border_style,
                 box=box.DOUBLE,
@@ -261,10 +708,143 @@ class PaginatedDisplay:
 
 
 class K8sQuest:
+    # Static UI tables, built once at import rather than on every call
+    _DIFFICULTY_COLORS = {
+        "beginner": "green",
+        "intermediate": "yellow",
+        "advanced": "red",
+        "expert": "magenta",
+    }
+
+    _DIFFICULTY_ICONS = {
+        "beginner": "⚡",
+        "intermediate": "⚡⚡",
+        "advanced": "⚡⚡⚡",
+        "expert": "💀",
+    }
+
+    # Plain-UI command menu, reprinted before every action
+    _COMMAND_MENU = "\n".join([
+        "=" * 60,
+        "[bold cyan]🎮 What would you like to do?[/bold cyan]",
+        "=" * 60,
+        "  [cyan]check[/cyan]     - 👁️  Monitor the resource status",
+        "  [cyan]guide[/cyan]     - 📖 Step-by-step instructions",
+        "  [cyan]hints[/cyan]     - 💡 Helpful kubectl commands",
+        "  [cyan]solution[/cyan]  - 📄 View the solution.yaml file",
+        "  [cyan]validate[/cyan]  - ✅ Test if you've fixed it",
+        "  [cyan]skip[/cyan]      - ⏭️  Skip this level",
+        "  [cyan]quit[/cyan]      - 🚪 Exit the game",
+        "=" * 60,
+    ])
+
+    # Shown after a failed validation, rotating with the attempt count
+    _ENCOURAGEMENT = tuple(
+        f"\n[yellow]{line}[/yellow]\n"
+        for line in (
+            "Don't give up! You're learning! 💪",
+            "Every mistake teaches you something! 🧠",
+            "Try the 'guide' option for step-by-step help! 📚",
+            "Use 'check' to see real-time status! 👀",
+        )
+    )
+
+    # Quick command hints for the legacy show_hints view
+    _HINTS = {
+        "level-1-pods": [
+            "Use `kubectl get pod nginx-broken -n k8squest` to check status",
+            "Use `kubectl describe pod nginx-broken -n k8squest` to see events",
+            "Use `kubectl logs nginx-broken -n k8squest` to check logs",
+            "The pod has a bad command. Check what command is being run.",
+            "Remember: You can't edit a running pod - delete and recreate it!",
+        ],
+        "level-2-deployments": [
+            "Use `kubectl get deployment web -n k8squest` to check status",
+            "Use `kubectl describe deployment web -n k8squest` for details",
+            "Scale with `kubectl scale deployment web --replicas=N -n k8squest`",
+            "Or edit with `kubectl edit deployment web -n k8squest`",
+        ],
+    }
+
+    # Step-by-step beginner guides, keyed by level name
+    _GUIDES = {
+        "level-1-pods": """
+# 🎓 Step-by-Step Guide: Fix the Crashing Pod
+
+## What's Wrong?
+The pod has a bad command `nginxzz` that doesn't exist.
+
+## How to Fix It:
+
+### Step 1: Check what's wrong
+```bash
+kubectl get pod nginx-broken -n k8squest
+kubectl describe pod nginx-broken -n k8squest
+```
+
+### Step 2: View the solution
+Look at the file: `worlds/world-1-basics/level-1-pods/solution.yaml`
+
+### Step 3: Delete the broken pod
+```bash
+kubectl delete pod nginx-broken -n k8squest
+```
+
+### Step 4: Apply the fix
+```bash
+kubectl apply -n k8squest -f worlds/world-1-basics/level-1-pods/solution.yaml
+```
+
+### Step 5: Verify it's working
+```bash
+kubectl get pod nginx-broken -n k8squest
+```
+Look for "Running" status!
+        """,
+        "level-2-deployments": """
+# 🎓 Step-by-Step Guide: Fix the Deployment
+
+## What's Wrong?
+The deployment has 0 replicas, so no pods are running.
+
+## How to Fix It:
+
+### Step 1: Check the deployment
+```bash
+kubectl get deployment web -n k8squest
+```
+
+### Step 2: Scale up the replicas
+```bash
+kubectl scale deployment web --replicas=2 -n k8squest
+```
+
+### Step 3: Verify it's working
+```bash
+kubectl get deployment web -n k8squest
+kubectl get pods -n k8squest
+```
+Look for "2/2" ready replicas!
+        """,
+    }
+
     def __init__(self):
         self.base_dir = Path(__file__).parent.parent
         self.progress_file = self.base_dir / "progress.json"
         self.progress = self.load_progress()
+        self._last_saved_progress = None  # Serialized form of the last save
+        self._proxy = KubeProxy()  # Started lazily on first status poll
+        self._bash = BashSession()  # Started lazily on first validate
+        self._levels_cache = None  # Per-level text bundles, loaded on first use
+        self._levels_cache_fingerprint = None  # Level files the bundle was built from
+        self._mission_cache = {}  # mission.yaml path -> ((mtime_ns, size), parsed mission)
+        self._level_index = None  # (worlds, level_choices) for the level picker
+        self._level_index_mtime = None
+        self._index_lock = threading.RLock()  # Guards index and bundle builds
+        self._world_levels = {}  # world name -> (mtime_ns, level paths)
+        self._progress_dirty = False  # Resume point changed but not yet written
+        self._last_save_time = 0.0
+        atexit.register(self._flush_progress)
 
     def load_progress(self):
         """Load player progress from JSON file"""
@@ -274,19 +854,51 @@ class K8sQuest:
                 # Ensure current_level exists for resume functionality
                 if "current_level" not in progress:
                     progress["current_level"] = None
-                return progress
-        return {
-            "total_xp": 0,
-            "completed_levels": [],
-            "current_world": "world-1-basics",
-            "current_level": None,
-            "player_name": "Padawan",
-        }
-
-    def save_progress(self):
-        """Save player progress"""
-        with open(self.progress_file, "w", encoding='utf-8') as f:
-            json.dump(self.progress, indent=2, fp=f)
+        else:
+            progress = {
+                "total_xp": 0,
+                "completed_levels": [],
+                "current_world": "world-1-basics",
+                "current_level": None,
+                "player_name": "Padawan",
+            }
+
+        # Set mirror of completed_levels for O(1) membership tests; the list
+        # stays the saved (ordered) form
+        self._completed_set = set(progress["completed_levels"])
+        return progress
+
+    def save_progress(self, pretty=False):
+        """Save player progress (skipped when nothing changed since the last save)"""
+        self._progress_dirty = False
+        self._last_save_time = time.monotonic()
+        data = _dump_progress(self.progress, pretty)
+        if data == self._last_saved_progress:
+            return
+        # Write-then-rename so a crash mid-write never leaves a truncated
+        # progress.json; no fsync, losing the last save on power-off is fine
+        tmp_file = self.progress_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.progress_file)
+        self._last_saved_progress = data
+
+    def _maybe_save(self):
+        """Mark progress dirty and save it at most every _PROGRESS_SAVE_INTERVAL seconds
+
+        Used for resume-point updates; anything still pending is written by
+        _flush_progress when the game exits.
+        """
+        self._progress_dirty = True
+        if time.monotonic() - self._last_save_time >= _PROGRESS_SAVE_INTERVAL:
+            self.save_progress()
+
+    def _flush_progress(self):
+        """On exit, write any pending save and leave progress.json pretty-printed
+
+        Sessions that never saved leave the file untouched.
+        """
+        if self._progress_dirty or self._last_saved_progress is not None:
+            self.save_progress(pretty=True)
 
     def show_welcome(self):
         """Display welcome screen with retro gaming style"""
@@ -296,38 +908,18 @@ class K8sQuest:
 
         console.clear()
 
-        # Retro-style title
-        title = """
-    ╦╔═╔═╗╔═╗ ╦ ╦╔═╗╔═╗╔╦╗
-    ╠╩╗╚═╗║═╬╗║ ║║╣ ╚═╗ ║
-    ╩ ╩╚═╝╚═╝╚╚═╝╚═╝╚═╝ ╩
-        """
-
-        welcome_panel = Panel(
-            Text(title, style="bold cyan")
-            + Text("\n🎮 Kubernetes Adventure Game 🎮\n", style="bold yellow")
-            + Text("Contra-Style Learning | Arcade Action | Boss Battles", style="dim"),
-            title="[bold magenta]⚔️  K8SQUEST  ⚔️[/bold magenta]",
-            border_style="cyan",
-            box=box.HEAVY,
-        )
-
-        console.print(welcome_panel)
-        console.print()
-
         # Player stats in retro gaming style
         stats = Table(show_header=False, box=box.HEAVY, border_style="yellow")
         stats.add_column("Stat", style="cyan bold")
         stats.add_column("Value", style="yellow bold")
         stats.add_row("🎮 PLAYER", self.progress["player_name"])
         stats.add_row("💎 TOTAL XP", str(self.progress["total_xp"]))
-        stats.add_row(
-            "⭐ LEVELS CLEARED", f"{len(self.progress['completed_levels'])}/50"
-        )
+        completed_count = len(self.progress["completed_levels"])
+        stats.add_row("⭐ LEVELS CLEARED", f"{completed_count}/50")
 
         # Calculate completion percentage
-        completion = (len(self.progress["completed_levels"]) / 50) * 100
-        progress_bar = "█" * int(completion / 5) + "░" * (20 - int(completion / 5))
+        completion = (completed_count / 50) * 100
+        progress_bar = _PROGRESS_BARS[min(int(completion / 5), 20)]
         stats.add_row("📊 PROGRESS", f"[{progress_bar}] {completion:.0f}%")
 
         # Show current level if resuming
@@ -339,47 +931,172 @@ class K8sQuest:
         safety_color = "green" if SAFETY_ENABLED else "red"
         stats.add_row("🛡️  SHIELDS", f"[{safety_color}]{safety_status}[/{safety_color}]")
 
-        console.print(
+        # Collect every section and print them as one Group so the terminal
+        # receives a single write
+        sections = [
+            _WELCOME_PANEL,
+            "",
             Panel(
                 stats,
                 title="[bold yellow]⚡ PLAYER STATUS ⚡[/bold yellow]",
                 border_style="yellow",
                 box=box.HEAVY,
-            )
-        )
+            ),
+        ]
 
         # Show XP progress bar
         if RETRO_UI_ENABLED:
-            console.print()
-            console.print(show_xp_bar(self.progress["total_xp"], 10200))
+            sections += ["", show_xp_bar(self.progress["total_xp"], 10200)]
 
         # Show safety reminder if enabled with gaming theme
         if SAFETY_ENABLED:
-            console.print()
-            console.print(
-                Panel(
-                    "[green]🛡️  DEFENSE SYSTEMS ONLINE[/green]\n"
-                    "[dim]✓ Prevents cluster destruction\n"
-                    "✓ Namespace protection active\n"
-                    "✓ Safe mode engaged\n"
-                    "Type 'safety info' for shield details[/dim]",
-                    border_style="green",
-                    box=box.HEAVY,
-                    title="[bold green]🔰 SAFETY PROTOCOLS[/bold green]",
-                )
+            sections += [
+                "",
+                _SAFETY_PANEL,
+            ]
+
+        console.print(Group(*sections, ""))
+
+    def _level_bundle(self, level_path):
+        """Return the bundled texts for a level, or None if it isn't bundled"""
+        if self._levels_cache is None:
+            with self._index_lock:
+                if self._levels_cache is None:
+                    self._levels_cache = self._load_levels_cache()
+        return self._levels_cache.get(_level_key(level_path))
+
+    def _refresh_levels_cache(self):
+        """Load the levels bundle, or reload it if a level file changed since
+
+        Called when the picker opens and when a level starts, so edits made
+        mid-session show up like they did when every file was re-read.
+        """
+        with self._index_lock:
+            try:
+                fingerprint = _levels_fingerprint(self.base_dir / "worlds")
+            except OSError:
+                fingerprint = None
+            if self._levels_cache is None or fingerprint != self._levels_cache_fingerprint:
+                self._levels_cache = self._load_levels_cache(fingerprint)
+
+    def _load_levels_cache(self, fingerprint=None):
+        """Load .levels_cache.json, rebuilding it when any level file changed
+
+        The bundle holds {"world/level": {mission, hints, debrief, solution}} for
+        every level so gameplay never has to reopen the individual files.
+        Rebuilds only re-read changed files; the rest come from the (path,
+        mtime, size) keyed text and mission caches.
+        """
+        worlds_dir = self.base_dir / "worlds"
+        cache_file = self.base_dir / ".levels_cache.json"
+
+        if fingerprint is None:
+            try:
+                fingerprint = _levels_fingerprint(worlds_dir)
+            except OSError:
+                self._levels_cache_fingerprint = None
+                return {}
+        self._levels_cache_fingerprint = fingerprint
+
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if cached.get("fingerprint") == fingerprint:
+                return cached["levels"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass  # Missing or stale - rebuild below
+
+        # Reading ~300 small files is latency-bound, so overlap the opens
+        from concurrent.futures import ThreadPoolExecutor
+
+        level_paths = sorted(worlds_dir.glob("*/level-*"))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            bundles = executor.map(self._bundle_level, level_paths)
+            levels = {
+                _level_key(level_path): bundle
+                for level_path, bundle in zip(level_paths, bundles)
+                if bundle is not None
+            }
+
+        try:
+            tmp_file = cache_file.with_suffix(".json.tmp")
+            tmp_file.write_text(
+                json.dumps({"fingerprint": fingerprint, "levels": levels}),
+                encoding='utf-8',
             )
-        console.print()
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+
+        return levels
+
+    def _bundle_level(self, level_path):
+        """Read one level's texts for the bundle; None for non-levels and broken levels"""
+        if not (level_path / "mission.yaml").is_file():
+            return None
+        try:
+            bundle = {
+                "mission": self._parse_mission(level_path),
+                "hints": [
+                    [i, _read_level_file(hint_file)]
+                    for i, hint_file in _hint_files(str(level_path), level_path.stat().st_mtime_ns)
+                ],
+            }
+            for key, name in (("debrief", "debrief.md"), ("solution", "solution.yaml")):
+                text_file = level_path / name
+                bundle[key] = _read_level_file(text_file) if text_file.is_file() else None
+        except Exception:
+            return None  # Broken level - it is read directly when played
+        return bundle
 
     def load_mission(self, level_path):
-        """Load mission metadata"""
+        """Load mission metadata, from the levels bundle when available"""
+        bundle = self._level_bundle(level_path)
+        if bundle is not None:
+            return bundle["mission"]
+        return self._parse_mission(level_path)
+
+    def _parse_mission(self, level_path):
+        """Parse a level's mission.yaml
+
+        Parsed missions are memoized per (path, mtime, size) for the session.
+        On a miss, a parsed copy cached next to the YAML as mission.json is
+        used whenever it is at least as new as mission.yaml.
+        """
         mission_file = level_path / "mission.yaml"
-        with open(mission_file, "r", encoding='utf-8', errors='replace') as f:
-            return yaml.safe_load(f)
+        cache_file = level_path / "mission.json"
 
-    def show_mission_briefing(self, mission, level_name):
-        """Display mission briefing screen"""
-        console.clear()
+        stat = mission_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        hit = self._mission_cache.get(mission_file)
+        if hit and hit[0] == stamp:
+            return hit[1]
+
+        try:
+            if cache_file.stat().st_mtime_ns >= stat.st_mtime_ns:
+                mission = json.loads(_read_level_file(cache_file))
+                self._mission_cache[mission_file] = (stamp, mission)
+                return mission
+        except (OSError, ValueError):
+            pass  # No usable cache - parse the YAML
+
+        import yaml
+
+        mission = yaml.load(_read_level_file(mission_file), Loader=_yaml_loader())
+
+        # Refresh the cache atomically; read-only checkouts simply skip it
+        try:
+            payload = json.dumps(mission)
+            tmp_file = level_path / "mission.json.tmp"
+            tmp_file.write_text(payload, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+
+        self._mission_cache[mission_file] = (stamp, mission)
+        return mission
 
+    def show_mission_briefing(self, mission, level_name):
+        """Display mission briefing screen (play_level clears the screen first)"""
         briefing = f"""
 # 🎯 {mission["name"]}
 
@@ -392,7 +1109,7 @@ class K8sQuest:
 
         console.print(
             Panel(
-                Markdown(briefing),
+                _markdown(briefing),
                 title=f"[bold cyan]Level: {level_name}[/bold cyan]",
                 border_style="yellow",
                 box=box.DOUBLE,
@@ -408,12 +1125,14 @@ class K8sQuest:
             hint_level: Current hint level (1-3)
             show_all: If True, show all unlocked hints. If False, show only the current hint level.
         """
-        hints_available = []
-
-        for i in range(1, 4):
-            hint_file = level_path / f"hint-{i}.txt"
-            if hint_file.exists():
-                hints_available.append((i, hint_file))
+        bundle = self._level_bundle(level_path)
+        if bundle is not None:
+            hints_available = bundle["hints"]
+        else:
+            hints_available = [
+                (i, _read_level_file(hint_file))
+                for i, hint_file in _hint_files(str(level_path), level_path.stat().st_mtime_ns)
+            ]
 
         if not hints_available:
             console.print("[yellow]No hints available for this level[/yellow]")
@@ -429,10 +1148,9 @@ class K8sQuest:
 
         if show_all:
             # Show all unlocked hints
-            for i, hint_file in hints_available:
+            for i, hint_text in hints_available:
                 if i <= hint_level:
-                    with open(hint_file, "r", encoding='utf-8', errors='replace') as f:
-                        hint_content = f.read().strip()
+                    hint_content = hint_text.strip()
 
                     hint_style = "cyan" if i == 1 else ("yellow" if i == 2 else "green")
                     console.print(
@@ -445,9 +1163,8 @@ class K8sQuest:
         else:
             # Show only the current hint level (newest unlocked hint)
             if hint_level <= len(hints_available):
-                i, hint_file = hints_available[hint_level - 1]
-                with open(hint_file, "r", encoding='utf-8', errors='replace') as f:
-                    hint_content = f.read().strip()
+                i, hint_text = hints_available[hint_level - 1]
+                hint_content = hint_text.strip()
 
                 hint_style = (
                     "cyan"
@@ -475,17 +1192,22 @@ class K8sQuest:
         console.print()
         return min(hint_level, len(hints_available))
 
+    def _level_text(self, level_path, key, file_name):
+        """Return a bundled level text (debrief/solution), or None if absent"""
+        bundle = self._level_bundle(level_path)
+        if bundle is not None:
+            return bundle[key]
+        text_file = level_path / file_name
+        return _read_level_file(text_file) if text_file.exists() else None
+
     def show_debrief(self, level_path):
         """Show the post-mission debrief with learning explanations"""
-        debrief_file = level_path / "debrief.md"
+        debrief_content = self._level_text(level_path, "debrief", "debrief.md")
 
-        if not debrief_file.exists():
+        if debrief_content is None:
             console.print("[yellow]No debrief available for this level[/yellow]")
             return
 
-        with open(debrief_file, "r", encoding='utf-8', errors='replace') as f:
-            debrief_content = f.read()
-
         # Use paginated display WITHOUT alternative buffer
         # This keeps the debrief visible in terminal history for reference
         paginator = PaginatedDisplay(console)
@@ -498,15 +1220,12 @@ class K8sQuest:
 
     def show_solution_file(self, level_path):
         """Display the solution.yaml file contents"""
-        solution_file = level_path / "solution.yaml"
+        solution_content = self._level_text(level_path, "solution", "solution.yaml")
 
-        if not solution_file.exists():
+        if solution_content is None:
             console.print("[yellow]No solution file available for this level[/yellow]")
             return
 
-        with open(solution_file, "r", encoding='utf-8', errors='replace') as f:
-            solution_content = f.read()
-
         console.print(
             Panel(
                 f"[cyan]{solution_content}[/cyan]",
@@ -519,23 +1238,7 @@ class K8sQuest:
 
     def show_hints(self, level_name, level_path=None):
         """Show helpful hints based on the level - DEPRECATED, use show_progressive_hints"""
-        hints = {
-            "level-1-pods": [
-                "Use `kubectl get pod nginx-broken -n k8squest` to check status",
-                "Use `kubectl describe pod nginx-broken -n k8squest` to see events",
-                "Use `kubectl logs nginx-broken -n k8squest` to check logs",
-                "The pod has a bad command. Check what command is being run.",
-                "Remember: You can't edit a running pod - delete and recreate it!",
-            ],
-            "level-2-deployments": [
-                "Use `kubectl get deployment web -n k8squest` to check status",
-                "Use `kubectl describe deployment web -n k8squest` for details",
-                "Scale with `kubectl scale deployment web --replicas=N -n k8squest`",
-                "Or edit with `kubectl edit deployment web -n k8squest`",
-            ],
-        }
-
-        level_hints = hints.get(level_name, ["Explore with kubectl commands!"])
+        level_hints = self._HINTS.get(level_name, ["Explore with kubectl commands!"])
 
         hint_table = Table(
             title="💡 Helpful Commands", box=box.ROUNDED, border_style="blue"
@@ -560,59 +1263,65 @@ class K8sQuest:
                     "[dim]💡 Tip: You can use this as a reference to fix the issue[/dim]\n"
                 )
 
+    def _list_resources(self):
+        """List k8squest resources via the kubectl proxy, falling back to one kubectl call"""
+        items = []
+        for kind, path in _RESOURCE_ENDPOINTS:
+            data = self._proxy.get_json(path)
+            if data is None:
+                break  # Proxy unavailable - use kubectl instead
+            for item in data.get("items", []):
+                item["kind"] = kind
+                items.append(item)
+        else:
+            return items
+
+        # Fetch all common resource types in a single kubectl round trip
+        result = subprocess.run(
+            [
+                "kubectl",
+                "get",
+                "pods,deployments,services,ingress,pvc,configmaps",
+                "-n",
+                "k8squest",
+                "-o",
+                "json",
+                "--request-timeout=3s",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            return []
+        return json.loads(result.stdout).get("items", [])
+
     def get_resource_status(self, level_name):
         """Get current status of Kubernetes resources in k8squest namespace"""
         try:
-            # Get common resource types
-            resource_types = [
-                "pods",
-                "deployments",
-                "services",
-                "ingress",
-                "pvc",
-                "configmaps",
-            ]
+            items = self._list_resources()
+            if not items:
+                return "No resources found"
+
             status_parts = []
+            shown_per_kind = {}
 
-            for resource_type in resource_types:
-                result = subprocess.run(
-                    ["kubectl", "get", resource_type, "-n", "k8squest", "--no-headers"],
-                    capture_output=True,
-                    text=True,
-                    timeout=3,
-                )
+            for item in items:
+                kind = item.get("kind")
+                fmt = _KIND_FMT.get(kind)
+                # Show up to 2 of each known type
+                if fmt is None or shown_per_kind.get(kind, 0) >= 2:
+                    continue
 
-                if result.returncode == 0 and result.stdout.strip():
-                    lines = result.stdout.strip().split("\n")
-
-                    for line in lines[:2]:  # Show up to 2 of each type
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            status = parts[1] if len(parts) > 1 else "?"
-
-                            # Format based on resource type
-                            if resource_type == "pods":
-                                status_parts.append(f"Pod {name}: {status}")
-                            elif resource_type == "deployments":
-                                status_parts.append(f"Deploy {name}: {status}")
-                            elif resource_type == "services":
-                                svc_type = parts[1] if len(parts) > 1 else "?"
-                                status_parts.append(f"Svc {name}: {svc_type}")
-                            elif resource_type == "ingress":
-                                hosts = parts[2] if len(parts) > 2 else "?"
-                                status_parts.append(f"Ingress {name}: {hosts}")
-                            elif resource_type == "pvc":
-                                status_parts.append(f"PVC {name}: {status}")
-                            elif resource_type == "configmaps":
-                                status_parts.append(f"CM {name}")
-
-                    # Limit total status parts to avoid clutter
-                    if len(status_parts) >= 3:
-                        break
+                status_parts.append(fmt(item))
+                shown_per_kind[kind] = shown_per_kind.get(kind, 0) + 1
+
+                # Limit total status parts to avoid clutter
+                if len(status_parts) >= 3:
+                    break
 
             if status_parts:
-                return " | ".join(status_parts[:3])
+                return " | ".join(status_parts)
             else:
                 return "No resources found"
 
@@ -621,8 +1330,6 @@ class K8sQuest:
         except Exception as e:
             return f"Checking..."
 
-        return "Checking..."
-
     def show_terminal_instructions(self, level_name):
         """Show clear instructions about opening another terminal"""
         instructions = Panel(
@@ -645,90 +1352,100 @@ class K8sQuest:
 
     def monitor_status(self, level_name, duration=10):
         """Monitor resource status in real-time"""
+        from rich.live import Live
+
         console.print(
             f"\n[yellow]👀 Monitoring status for {duration} seconds...[/yellow]\n"
         )
 
-        status_table = Table(box=box.SIMPLE, show_header=True, header_style="bold cyan")
-        status_table.add_column("Time", style="dim")
-        status_table.add_column("Status", style="yellow")
-
-        with Live(status_table, refresh_per_second=2, console=console) as live:
-            for i in range(duration):
-                status = self.get_resource_status(level_name)
-                status_table.add_row(datetime.now().strftime("%H:%M:%S"), status)
-                time.sleep(1)
+        # Keep only the most recent rows so each redraw stays the same size
+        rows = deque(maxlen=_MONITOR_ROWS)
+
+        def record(status):
+            rows.append((datetime.now().strftime("%H:%M:%S"), status))
+            status_table = Table(box=box.SIMPLE, show_header=True, header_style="bold cyan")
+            status_table.add_column("Time", style="dim")
+            status_table.add_column("Status", style="yellow")
+            for row in rows:
+                status_table.add_row(*row)
+            return status_table
+
+        deadline = time.monotonic() + duration
+        # Initial snapshot, then a fresh row only when something changes;
+        # the display is redrawn only when a row is added
+        with Live(
+            record(self.get_resource_status(level_name)),
+            auto_refresh=False,
+            console=console,
+        ) as live:
+            for _ in self._resource_change_events(deadline):
+                live.update(record(self.get_resource_status(level_name)), refresh=True)
 
         console.print()
 
-    def show_step_by_step_guide(self, level_name):
-        """Show detailed step-by-step guide for beginners"""
-        guides = {
-            "level-1-pods": """
-# 🎓 Step-by-Step Guide: Fix the Crashing Pod
-
-## What's Wrong?
-The pod has a bad command `nginxzz` that doesn't exist.
-
-## How to Fix It:
-
-### Step 1: Check what's wrong
-```bash
-kubectl get pod nginx-broken -n k8squest
-kubectl describe pod nginx-broken -n k8squest
-```
-
-### Step 2: View the solution
-Look at the file: `worlds/world-1-basics/level-1-pods/solution.yaml`
-
-### Step 3: Delete the broken pod
-```bash
-kubectl delete pod nginx-broken -n k8squest
-```
-
-### Step 4: Apply the fix
-```bash
-kubectl apply -n k8squest -f worlds/world-1-basics/level-1-pods/solution.yaml
-```
-
-### Step 5: Verify it's working
-```bash
-kubectl get pod nginx-broken -n k8squest
-```
-Look for "Running" status!
-            """,
-            "level-2-deployments": """
-# 🎓 Step-by-Step Guide: Fix the Deployment
-
-## What's Wrong?
-The deployment has 0 replicas, so no pods are running.
-
-## How to Fix It:
+    def _resource_change_events(self, deadline):
+        """Yield each time pods in k8squest change, until the deadline passes
 
-### Step 1: Check the deployment
-```bash
-kubectl get deployment web -n k8squest
-```
+        Streams `kubectl get pods --watch-only` instead of polling. kubectl can
+        only watch one resource type at a time; pods are the one every level
+        touches (deployment rollouts surface as pod events too). If the watch
+        can't start or ends early, falls back to yielding once a second.
+        """
+        try:
+            watcher = subprocess.Popen(
+                ["kubectl", "get", "pods", "-n", "k8squest", "--watch-only", "--no-headers"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            watcher = None
 
-### Step 2: Scale up the replicas
-```bash
-kubectl scale deployment web --replicas=2 -n k8squest
-```
+        try:
+            if watcher is not None:
+                # Read on a thread so waiting with a timeout works on every platform
+                events = queue.Queue()
+                threading.Thread(
+                    target=_pump_lines, args=(watcher.stdout, events), daemon=True
+                ).start()
+
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    try:
+                        line = events.get(timeout=remaining)
+                    except queue.Empty:
+                        return
+                    if line is None:
+                        break  # Watch ended early - poll for the rest
+
+                    # Coalesce a burst of events into a single refresh
+                    eof = False
+                    while not events.empty():
+                        if events.get_nowait() is None:
+                            eof = True
+                            break
+                    yield
+                    if eof:
+                        break  # Watch ended early - poll for the rest
 
-### Step 3: Verify it's working
-```bash
-kubectl get deployment web -n k8squest
-kubectl get pods -n k8squest
-```
-Look for "2/2" ready replicas!
-            """,
-        }
+            while time.monotonic() + 1 <= deadline:
+                time.sleep(1)
+                yield
+            time.sleep(max(0, deadline - time.monotonic()))
+        finally:
+            if watcher is not None and watcher.poll() is None:
+                watcher.terminate()
+                watcher.wait()
 
-        guide = guides.get(level_name, "No guide available for this level.")
+    def show_step_by_step_guide(self, level_name):
+        """Show detailed step-by-step guide for beginners"""
+        guide = self._GUIDES.get(level_name, "No guide available for this level.")
 
         console.print(
             Panel(
-                Markdown(guide),
+                _markdown(guide),
                 title="[bold green]📚 Beginner's Guide[/bold green]",
                 border_style="green",
                 box=box.ROUNDED,
@@ -738,6 +1455,8 @@ Look for "2/2" ready replicas!
 
     def deploy_mission(self, level_path, level_name):
         """Deploy the broken Kubernetes resources"""
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
         console.print("\n[yellow]🚀 Deploying mission environment...[/yellow]")
 
         with Progress(
@@ -748,34 +1467,50 @@ Look for "2/2" ready replicas!
         ) as progress:
             task = progress.add_task("Setting up namespace...", total=3)
 
-            # Delete and recreate namespace
-            result = subprocess.run(
+            # Delete the old namespace. This waits for it to be gone: applying
+            # into a namespace that is still terminating would be rejected
+            subprocess.run(
                 ["kubectl", "delete", "namespace", "k8squest", "--ignore-not-found"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
+            progress.update(task, description="Deploying broken resources...")
             progress.advance(task)
 
+            # Check if level has a setup script (for levels needing history like rollback)
+            setup_script = level_path / "setup.sh"
+            has_setup_script = setup_script.exists()
+
+            # Recreate the namespace and, for regular levels, the broken
+            # resources with a single `kubectl apply` fed through stdin
+            manifest = _NAMESPACE_MANIFEST
+            if not has_setup_script:
+                try:
+                    manifest += "---\n" + _read_level_file(level_path / "broken.yaml")
+                except OSError as e:
+                    console.print("\n[red]⚠️  Deployment failed:[/red]")
+                    console.print(f"[dim red]Could not read broken.yaml: {e}[/dim red]")
+                    return False
+
             result = subprocess.run(
-                ["kubectl", "create", "namespace", "k8squest"],
-                capture_output=True,
+                ["kubectl", "apply", "-f", "-"],
+                input=manifest,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
-            
-            # Check for namespace creation errors
+
+            # Show errors if deployment fails
             if result.returncode != 0:
-                console.print(f"\n[red]⚠️  Failed to create namespace:[/red]")
+                console.print("\n[red]⚠️  Deployment failed:[/red]")
                 console.print(f"[dim red]{result.stderr}[/dim red]")
                 console.print("[yellow]💡 Hint: Make sure your kubectl context is set correctly[/yellow]")
                 console.print("[dim]Run: kubectl config use-context kind-k8squest[/dim]")
                 return False
-            
-            progress.update(task, description="Deploying broken resources...")
+
             progress.advance(task)
 
-            # Check if level has a setup script (for levels needing history like rollback)
-            setup_script = level_path / "setup.sh"
-            if setup_script.exists():
+            if has_setup_script:
                 console.print("[yellow]Running level setup script...[/yellow]")
                 result = subprocess.run(
                     ["bash", str(setup_script)],
@@ -791,18 +1526,6 @@ Look for "2/2" ready replicas!
                     if result.stdout:
                         console.print(f"[dim]{result.stdout}[/dim]")
                     return False
-            else:
-                # Apply broken config (without forcing namespace to respect YAML)
-                result = subprocess.run(
-                    ["kubectl", "apply", "-f", str(level_path / "broken.yaml")],
-                    capture_output=True,
-                    text=True,
-                )
-                # Show errors if deployment fails
-                if result.returncode != 0:
-                    console.print(f"[red]Deployment failed:[/red]")
-                    console.print(f"[dim red]{result.stderr}[/dim red]")
-                    return False
 
             progress.update(task, description="✅ Environment ready!")
             progress.advance(task)
@@ -826,28 +1549,130 @@ Look for "2/2" ready replicas!
         console.print()
         return True  # Deployment successful
 
+    def _run_declarative_check(self, check):
+        """Evaluate a mission.yaml `validate:` block against the live object
+
+        The block names a resource and the fields it must have, e.g.
+
+            validate:
+              kind: Pod
+              name: nginx-broken
+              expect:
+                status.phase: Running
+                status.containerStatuses.0.ready: true
+
+        Returns a CompletedProcess shaped like a validate.sh run, or None if
+        the check can't be evaluated here (malformed block, no expectations,
+        unknown kind, API unreachable).
+        """
+        # A block without expectations would pass on the broken resource
+        if not isinstance(check, dict):
+            return None
+        kind = check.get("kind")
+        name = check.get("name")
+        expect = check.get("expect")
+        if not isinstance(kind, str) or not isinstance(name, str) or not name:
+            return None
+        if not isinstance(expect, dict) or not expect:
+            return None
+        base_path = dict(_RESOURCE_ENDPOINTS).get(kind)
+        if base_path is None:
+            return None
+
+        resource = self._proxy.get_json(f"{base_path}/{name}")
+        if resource is None:
+            return None
+
+        if not resource:
+            lines = [f"❌ {kind} '{name}' not found in namespace k8squest"]
+            passed = False
+        else:
+            lines = [f"🔍 Checking {kind} '{name}'..."]
+            passed = True
+            for field, expected in expect.items():
+                actual = _lookup_field(resource, field)
+                matched = actual == expected
+                passed = passed and matched
+                icon = "✅" if matched else "❌"
+                lines.append(f"{icon} {field}: {actual} (expected {expected})")
+
+        return subprocess.CompletedProcess(
+            args=["validate", kind, name],
+            returncode=0 if passed else 1,
+            stdout="\n".join(lines) + "\n",
+            stderr="",
+        )
+
+    def _run_validate_script(self, level_path):
+        """Run a level's validate.sh, printing its output as the lines arrive
+
+        Scripts run in the shared BashSession; a one-off bash is spawned only if
+        that session can't be used. stderr is merged into stdout so messages
+        keep their order. Returns a CompletedProcess holding the full output
+        for the result panel.
+        """
+        lines = []
+
+        def echo(line):
+            lines.append(line)
+            console.print(line.rstrip("\n"), style="dim", markup=False)
+
+        returncode = self._bash.run(level_path, "validate.sh", echo)
+        if returncode is None:
+            process = subprocess.Popen(
+                ["bash", str(level_path / "validate.sh")],
+                cwd=str(level_path),  # CRITICAL: Run from level directory
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                env={**os.environ}  # Pass through environment variables
+            )
+            with process.stdout:
+                for line in process.stdout:
+                    echo(line)
+            returncode = process.wait()
+
+        return subprocess.CompletedProcess(
+            args=["bash", "validate.sh"],
+            returncode=returncode,
+            stdout="".join(lines),
+            stderr="",
+        )
+
     def validate_mission(self, level_path, level_name):
         """Run validation script and show results"""
         console.print("\n[yellow]🔍 Validating your solution...[/yellow]\n")
 
-        validate_script = level_path / "validate.sh"
-        
-        # Run validation script from the level directory with proper environment
-        result = subprocess.run(
-            ["bash", str(validate_script)],
-            cwd=str(level_path),  # CRITICAL: Run from level directory
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            env={**os.environ}  # Pass through environment variables
-        )
+        # Simple checks declared in mission.yaml are answered straight from the
+        # API; anything else (or an unreachable API) runs validate.sh
+        check = self.load_mission(level_path).get("validate")
+        result = self._run_declarative_check(check) if check else None
 
-        # Always show output for debugging
-        if result.stdout:
+        # Always show output for debugging - validate.sh echoes it live
+        if result is None:
+            result = self._run_validate_script(level_path)
+        elif result.stdout:
             console.print(f"[dim]{result.stdout}[/dim]")
-        if result.stderr and result.returncode != 0:
-            console.print(f"[dim red]Error output: {result.stderr}[/dim red]")
+
+        if result.returncode == BashSession.ABORTED:
+            console.print(
+                Panel(
+                    Text(
+                        "⚠️  Validation aborted", style="bold yellow", justify="center"
+                    )
+                    + Text(
+                        "\n\nThe shell running validate.sh exited before the check finished."
+                        "\nThis says nothing about your fix - try validating again.",
+                        style="yellow",
+                    ),
+                    border_style="yellow",
+                    box=box.ROUNDED,
+                )
+            )
+            return False
 
         if result.returncode == 0:
             # Success!
@@ -878,7 +1703,9 @@ Look for "2/2" ready replicas!
 
     def play_level(self, level_path, level_name):
         """Play a single level with retro gaming UI"""
+        self._refresh_levels_cache()
         mission = self.load_mission(level_path)
+        difficulty = mission.get("difficulty", "beginner")
 
         # Show retro level start screen
         if RETRO_UI_ENABLED:
@@ -887,7 +1714,7 @@ Look for "2/2" ready replicas!
                 level_num,
                 mission["name"],
                 mission["xp"],
-                mission.get("difficulty", "beginner"),
+                difficulty,
             )
             input()  # Wait for player to press any key
 
@@ -904,23 +1731,8 @@ Look for "2/2" ready replicas!
             console.print()
 
         # Display difficulty and time estimate with gaming flair
-        difficulty_colors = {
-            "beginner": "green",
-            "intermediate": "yellow",
-            "advanced": "red",
-            "expert": "magenta",
-        }
-        diff_color = difficulty_colors.get(
-            mission.get("difficulty", "beginner"), "cyan"
-        )
-
-        difficulty_icons = {
-            "beginner": "⚡",
-            "intermediate": "⚡⚡",
-            "advanced": "⚡⚡⚡",
-            "expert": "💀",
-        }
-        diff_icon = difficulty_icons.get(mission.get("difficulty", "beginner"), "⚡")
+        diff_color = self._DIFFICULTY_COLORS.get(difficulty, "cyan")
+        diff_icon = self._DIFFICULTY_ICONS.get(difficulty, "⚡")
 
         metadata = f"[{diff_color}]{diff_icon}[/{diff_color}] {mission.get('difficulty', 'Unknown').upper()}"
         metadata += f"  |  ⏱️  ~{mission.get('expected_time', '?')}"
@@ -964,21 +1776,7 @@ Look for "2/2" ready replicas!
             if RETRO_UI_ENABLED:
                 console.print(show_command_menu())
             else:
-                console.print("=" * 60)
-                console.print("[bold cyan]🎮 What would you like to do?[/bold cyan]")
-                console.print("=" * 60)
-                console.print(
-                    "  [cyan]check[/cyan]     - 👁️  Monitor the resource status"
-                )
-                console.print("  [cyan]guide[/cyan]     - 📖 Step-by-step instructions")
-                console.print("  [cyan]hints[/cyan]     - 💡 Helpful kubectl commands")
-                console.print(
-                    "  [cyan]solution[/cyan]  - 📄 View the solution.yaml file"
-                )
-                console.print("  [cyan]validate[/cyan]  - ✅ Test if you've fixed it")
-                console.print("  [cyan]skip[/cyan]      - ⏭️  Skip this level")
-                console.print("  [cyan]quit[/cyan]      - 🚪 Exit the game")
-                console.print("=" * 60)
+                console.print(self._COMMAND_MENU)
 
             console.print()
 
@@ -1046,7 +1844,8 @@ Look for "2/2" ready replicas!
                         xp_earned = mission["xp"]
                         self.progress["total_xp"] += xp_earned
 
-                    if level_name not in self.progress["completed_levels"]:
+                    if level_name not in self._completed_set:
+                        self._completed_set.add(level_name)
                         self.progress["completed_levels"].append(level_name)
                     self.save_progress()
 
@@ -1082,15 +1881,8 @@ Look for "2/2" ready replicas!
                 else:
                     # Unlock next hint on failure
                     current_hint_level = min(current_hint_level + 1, 3)
-                    encouragement = [
-                        "Don't give up! You're learning! 💪",
-                        "Every mistake teaches you something! 🧠",
-                        "Try the 'guide' option for step-by-step help! 📚",
-                        "Use 'check' to see real-time status! 👀",
-                    ]
-                    console.print(
-                        f"\n[yellow]{encouragement[attempts % len(encouragement)]}[/yellow]\n"
-                    )
+                    encouragement = self._ENCOURAGEMENT
+                    console.print(encouragement[attempts % len(encouragement)])
 
                     if not Confirm.ask("Try again?", default=True):
                         return False
@@ -1107,152 +1899,172 @@ Look for "2/2" ready replicas!
                 )
                 sys.exit(0)
 
+    def _levels_for(self, world_name, mtime_ns=None):
+        """A world's level directories, rescanned only when the world dir changes
+
+        Returns None if the world doesn't exist. Callers that already
+        stat()ed the directory can pass its mtime_ns.
+        """
+        world_path = self.base_dir / "worlds" / world_name
+        if mtime_ns is None:
+            try:
+                mtime_ns = world_path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        hit = self._world_levels.get(world_name)
+        if hit and hit[0] == mtime_ns:
+            return hit[1]
+
+        levels = _level_dirs(world_path)
+        self._world_levels[world_name] = (mtime_ns, levels)
+        return levels
+
+    def _get_level_index(self):
+        """Collect every world's levels and display names
+
+        Returns (worlds, level_choices): worlds maps each present world to its
+        level paths, and level_choices holds (level_name, world_name,
+        level_path, display_name) in menu order. The result is reused until
+        the worlds directory, one of the world directories or the levels
+        bundle changes.
+        """
+        # The index may be prewarmed from a background thread; callers
+        # arriving mid-build wait for it instead of scanning again
+        with self._index_lock:
+            self._refresh_levels_cache()
+            worlds_dir = self.base_dir / "worlds"
+
+            mtimes = []
+            for world_name in _ALL_WORLDS:
+                try:
+                    mtimes.append((worlds_dir / world_name).stat().st_mtime_ns)
+                except OSError:
+                    mtimes.append(None)
+            mtime = (
+                worlds_dir.stat().st_mtime_ns,
+                tuple(mtimes),
+                self._levels_cache_fingerprint,
+            )
+            if self._level_index is not None and self._level_index_mtime == mtime:
+                return self._level_index
+
+            # Collect all levels from all worlds
+            worlds = {}
+            level_choices = []
+            for world_name, world_mtime in zip(_ALL_WORLDS, mtimes):
+                if world_mtime is None:
+                    continue
+                worlds[world_name] = self._levels_for(world_name, world_mtime)
+
+                for level_path in worlds[world_name]:
+                    level_name = level_path.name
+
+                    # Load mission to get the name
+                    mission_file = level_path / "mission.yaml"
+                    if mission_file.exists():
+                        mission = self.load_mission(level_path)
+                        display_name = mission.get("name", level_name)
+                    else:
+                        display_name = level_name
+
+                    level_choices.append((level_name, world_name, level_path, display_name))
+
+            self._level_index = (worlds, level_choices)
+            self._level_index_mtime = mtime
+            return self._level_index
+
+    def _prewarm_level_index(self):
+        """Background-thread target; any error resurfaces when the picker opens"""
+        try:
+            self._get_level_index()
+        except Exception:
+            pass
+
     def play_specific_level(self):
         """Allow user to select and play a specific level"""
-        import re
-
-        # Get all worlds and their levels
-        worlds = {}
-        all_worlds = [
-            "world-1-basics",
-            "world-2-deployments",
-            "world-3-networking",
-            "world-4-storage",
-            "world-5-security",
-        ]
+        while True:
+            worlds, level_choices = self._get_level_index()
 
-        def natural_sort_key(path):
-            """Extract numbers from path for natural sorting"""
-            parts = re.split(r"(\d+)", path.name)
-            return [int(part) if part.isdigit() else part for part in parts]
-
-        # Collect all levels from all worlds
-        for world_name in all_worlds:
-            world_path = self.base_dir / "worlds" / world_name
-            if world_path.exists():
-                levels = sorted(
-                    [d for d in world_path.iterdir() if d.is_dir()],
-                    key=natural_sort_key,
-                )
-                worlds[world_name] = levels
+            # Display all levels organized by world
+            console.clear()
+            console.print(_SELECT_LEVEL_PANEL)
+            console.print()
 
-        # Display all levels organized by world
-        console.clear()
-        console.print(
-            Panel("[bold cyan]Select a Level to Play[/bold cyan]", border_style="cyan")
-        )
-        console.print()
+            # Assemble the whole menu and render it in one print
+            lines = []
+            current_world = None
+            for level_num, (level_name, world_name, level_path, display_name) in enumerate(
+                level_choices, 1
+            ):
+                if world_name != current_world:
+                    current_world = world_name
+                    lines.append(f"\n[bold yellow]{_WORLD_DISPLAY[world_name]}[/bold yellow]")
 
-        level_choices = []
-        display_list = []
+                # Check if completed
+                status = "✅" if level_name in self._completed_set else "⭕"
+                lines.append(f"  [{level_num:2d}] {status} {display_name}")
 
-        for world_name in all_worlds:
-            if world_name not in worlds:
-                continue
+            lines.append("\n[dim]Enter level number or 'q' to quit[/dim]\n")
+            console.print("\n".join(lines))
 
-            world_display = (
-                world_name.replace("world-", "World ").replace("-", " ").title()
-            )
-            console.print(f"\n[bold yellow]{world_display}[/bold yellow]")
+            # Get user selection; typos just re-prompt below the menu
+            while True:
+                choice = Prompt.ask("Choose a level", default="q")
 
-            for level_path in worlds[world_name]:
-                level_name = level_path.name
-                # Check if completed
-                status = (
-                    "✅" if level_name in self.progress["completed_levels"] else "⭕"
-                )
+                if choice.lower() == "q":
+                    console.print("\n[yellow]Returning to menu...[/yellow]\n")
+                    return
 
-                # Load mission to get the name
-                mission_file = level_path / "mission.yaml"
-                if mission_file.exists():
-                    with open(mission_file, "r", encoding='utf-8', errors='replace') as f:
-                        mission = yaml.safe_load(f)
-                        display_name = mission.get("name", level_name)
-                else:
-                    display_name = level_name
+                try:
+                    level_index = int(choice) - 1
+                except ValueError:
+                    console.print("[red]Please enter a valid number[/red]")
+                    continue
 
-                level_num = len(level_choices) + 1
-                level_choices.append((level_name, world_name, level_path))
-                display_list.append(f"  [{level_num:2d}] {status} {display_name}")
-                console.print(display_list[-1])
+                if 0 <= level_index < len(level_choices):
+                    break
+                console.print("[red]Invalid level number[/red]")
 
-        console.print("\n[dim]Enter level number or 'q' to quit[/dim]\n")
+            level_name, world_name, level_path, _ = level_choices[level_index]
 
-        # Get user selection
-        choice = Prompt.ask("Choose a level", default="q")
+            # Update progress to this level
+            self.progress["current_level"] = level_name
+            self.progress["current_world"] = world_name
+            self._maybe_save()
 
-        if choice.lower() == "q":
-            console.print("\n[yellow]Returning to menu...[/yellow]\n")
-            return
+            # Play the level
+            self.play_level(level_path, level_name)
 
-        try:
-            level_index = int(choice) - 1
-            if 0 <= level_index < len(level_choices):
-                level_name, world_name, level_path = level_choices[level_index]
-
-                # Update progress to this level
-                self.progress["current_level"] = level_name
-                self.progress["current_world"] = world_name
-                self.save_progress()
-
-                # Play the level
-                self.play_level(level_path, level_name)
-
-                # After playing, ask what to do next
-                console.print("\n[cyan]What would you like to do?[/cyan]")
-                console.print("  [1] Play another level")
-                console.print("  [2] Continue from here")
-                console.print("  [q] Quit")
-                console.print()
+            # After playing, ask what to do next
+            console.print("\n[cyan]What would you like to do?[/cyan]")
+            console.print("  [1] Play another level")
+            console.print("  [2] Continue from here")
+            console.print("  [q] Quit")
+            console.print()
 
-                next_choice = Prompt.ask(
-                    "Your choice", choices=["1", "2", "q"], default="q"
-                )
+            next_choice = Prompt.ask(
+                "Your choice", choices=["1", "2", "q"], default="q"
+            )
 
-                if next_choice == "1":
-                    self.play_specific_level()  # Recursive call to play another
-                elif next_choice == "2":
-                    # Continue from this world
-                    all_worlds_list = [
-                        "world-1-basics",
-                        "world-2-deployments",
-                        "world-3-networking",
-                        "world-4-storage",
-                        "world-5-security",
-                    ]
-                    start_world_index = all_worlds_list.index(world_name)
-                    for world in all_worlds_list[start_world_index:]:
-                        if not self.play_world(world):
-                            break
-            else:
-                console.print("[red]Invalid level number[/red]")
-                time.sleep(1)
-                self.play_specific_level()
-        except ValueError:
-            console.print("[red]Please enter a valid number[/red]")
-            time.sleep(1)
-            self.play_specific_level()
+            if next_choice == "1":
+                continue  # Back to the picker to play another
+            elif next_choice == "2":
+                # Continue from this world
+                for world in _ALL_WORLDS[_WORLD_INDEX[world_name]:]:
+                    if not self.play_world(world):
+                        break
+            return
 
     def play_world(self, world_name):
         """Play all levels in a world"""
-        world_path = self.base_dir / "worlds" / world_name
+        # Get all level directories with natural sorting (level-1, level-2, ..., level-10)
+        levels = self._levels_for(world_name)
 
-        if not world_path.exists():
+        if levels is None:
             console.print(f"[red]Error: World '{world_name}' not found[/red]")
             return False
 
-        # Get all level directories with natural sorting (level-1, level-2, ..., level-10)
-        import re
-
-        def natural_sort_key(path):
-            """Extract numbers from path for natural sorting"""
-            parts = re.split(r"(\d+)", path.name)
-            return [int(part) if part.isdigit() else part for part in parts]
-
-        levels = sorted(
-            [d for d in world_path.iterdir() if d.is_dir()], key=natural_sort_key
-        )
-
         # Find where to resume from
         start_index = 0
         if self.progress.get("current_level"):
@@ -1262,7 +2074,7 @@ Look for "2/2" ready replicas!
                     # If the level is already completed, start from the next one
                     if (
                         self.progress["current_level"]
-                        in self.progress["completed_levels"]
+                        in self._completed_set
                     ):
                         start_index = i + 1
                     else:
@@ -1276,7 +2088,7 @@ Look for "2/2" ready replicas!
             # Save current level before playing
             self.progress["current_level"] = level_name
             self.progress["current_world"] = world_name
-            self.save_progress()
+            self._maybe_save()
 
             if not self.play_level(level_path, level_name):
                 return False  # Player quit or stopped
@@ -1313,14 +2125,8 @@ def main():
 
     game.show_welcome()
 
-    # All 5 worlds in order
-    all_worlds = [
-        "world-1-basics",
-        "world-2-deployments",
-        "world-3-networking",
-        "world-4-storage",
-        "world-5-security",
-    ]
+    # Build the level index while the player reads the menu
+    threading.Thread(target=game._prewarm_level_index, daemon=True).start()
 
     # Check if there's progress to resume
     has_progress = len(game.progress["completed_levels"]) > 0 or game.progress.get(
@@ -1355,15 +2161,9 @@ def main():
         choice = Prompt.ask("Your choice", choices=["1", "2", "3", "q"], default="1")
 
         if choice == "1":
-            # Find which world to start from
-            start_world_index = 0
-            for i, world in enumerate(all_worlds):
-                if world == current_world:
-                    start_world_index = i
-                    break
-
             # Play from current world through to the end
-            for world in all_worlds[start_world_index:]:
+            start_world_index = _WORLD_INDEX.get(current_world, 0)
+            for world in _ALL_WORLDS[start_world_index:]:
                 if not game.play_world(world):
                     break  # Player quit
 
@@ -1374,11 +2174,12 @@ def main():
         elif choice == "3":
             game.progress["current_level"] = None
             game.progress["completed_levels"] = []
+            game._completed_set.clear()
             game.progress["total_xp"] = 0
             game.save_progress()
 
             # Play all worlds from the beginning
-            for world in all_worlds:
+            for world in _ALL_WORLDS:
                 if not game.play_world(world):
                     break  # Player quit
         else:
@@ -1386,7 +2187,7 @@ def main():
     else:
         if Confirm.ask("Ready to start your training?", default=True):
             # Play all worlds from the beginning
-            for world in all_worlds:
+            for world in _ALL_WORLDS:
                 if not game.play_world(world):
                     break  # Player quit
         else:
@@ -37,6 +37,9 @@ fi
 pip install -q -r requirements.txt
 
 echo "✅ Python packages installed"
+
+# Precompile mission.yaml files to JSON so levels load without a YAML parse
+python3 tools/build_mission_cache.py
 echo ""
 
 # Create Kubernetes cluster
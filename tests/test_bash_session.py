@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent bash session that runs validate.sh scripts
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.engine import BashSession
+
+
+def run_script(session, tmp_path, body, name="validate.sh"):
+    """Write body to tmp_path/name and run it, returning (status, output)"""
+    (tmp_path / name).write_text(body, encoding="utf-8")
+    lines = []
+    status = session.run(tmp_path, name, lines.append)
+    return status, "".join(lines)
+
+
+def test_exit_status_and_output(tmp_path):
+    """Each script's output and exit status come back separately"""
+    session = BashSession()
+    try:
+        assert run_script(session, tmp_path, "echo one\necho two\n") == (0, "one\ntwo\n")
+        assert run_script(session, tmp_path, "echo failing\nfalse\n") == (1, "failing\n")
+        assert run_script(session, tmp_path, "echo oops >&2\nexit 3\n") == (3, "oops\n")
+    finally:
+        session.stop()
+
+
+def test_output_without_trailing_newline(tmp_path):
+    """Output sharing a line with the marker is still passed on"""
+    session = BashSession()
+    try:
+        assert run_script(session, tmp_path, "printf 'no newline'\n") == (0, "no newline")
+    finally:
+        session.stop()
+
+
+def test_script_state_stays_in_the_script(tmp_path):
+    """exit, cd and set -e inside a script don't affect the session"""
+    session = BashSession()
+    try:
+        assert run_script(session, tmp_path, "set -e\nfalse\necho unreachable\n") == (1, "")
+        assert run_script(session, tmp_path, "cd /\nexit 0\n") == (0, "")
+
+        # Still alive, with set -e gone and the level directory as cwd
+        status, output = run_script(session, tmp_path, "false\npwd\n")
+        assert status == 0
+        assert output == f"{tmp_path.resolve()}\n"
+    finally:
+        session.stop()
+
+
+def test_stdin_is_dev_null(tmp_path):
+    """A script reading stdin gets EOF instead of consuming later commands"""
+    session = BashSession()
+    try:
+        status, output = run_script(
+            session, tmp_path, "if read -r line; then echo \"read: $line\"; else echo eof; fi\n"
+        )
+        assert (status, output) == (0, "eof\n")
+        assert run_script(session, tmp_path, "echo next\n") == (0, "next\n")
+    finally:
+        session.stop()
+
+
+def test_dead_shell_aborts_then_restarts(tmp_path):
+    """Killing the session's bash reports ABORTED, and the next run restarts it"""
+    session = BashSession()
+    try:
+        status, output = run_script(session, tmp_path, "echo before\nkill -9 $$\n")
+        assert status == BashSession.ABORTED
+        assert output == "before\n"
+
+        assert run_script(session, tmp_path, "echo again\n") == (0, "again\n")
+    finally:
+        session.stop()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the K8sQuest world completion certificates
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import certificate
+
+
+def test_generate_certificate_contents():
+    """Certificate lists player, world, XP and every skill"""
+    cert = certificate.generate_certificate(1, "Jane Doe", 1450)
+
+    assert "Player: Jane Doe" in cert
+    assert "World: Core Kubernetes Basics" in cert
+    assert "1450 XP Earned" in cert
+    assert "    1. Debug CrashLoopBackOff errors" in cert
+    assert "   10. Handle resource quotas" in cert
+    assert "Next: World 2 - Deployments & Scaling" in cert
+
+
+def test_generate_certificate_unknown_world():
+    """Unknown worlds produce no certificate"""
+    assert certificate.generate_certificate(99, "Jane Doe", 0) is None
+
+
+def test_save_certificates(tmp_path, monkeypatch):
+    """Batch save writes one file per world, or a single archive"""
+    monkeypatch.setattr(certificate, "_CERT_DIR", tmp_path)
+    monkeypatch.setattr(certificate, "_dir_ready", False)
+
+    items = [
+        (1, certificate.generate_certificate(1, "Jane Doe", 1450)),
+        (2, certificate.generate_certificate(2, "Jane Doe", 3450)),
+    ]
+
+    files = certificate.save_certificates(items)
+    assert [f.name for f in files] == ["world-1-completion.txt", "world-2-completion.txt"]
+    assert files[0].read_text(encoding="utf-8") == items[0][1]
+
+    (archive,) = certificate.save_certificates(items, archive_name="all.txt")
+    content = archive.read_text(encoding="utf-8")
+    assert items[0][1] in content and items[1][1] in content
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the declarative mission.yaml `validate:` checks
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.engine import K8sQuest, _lookup_field
+
+POD = {
+    "metadata": {"name": "nginx-broken"},
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [{"name": "nginx", "ready": True}],
+    },
+}
+
+
+class StubProxy:
+    """Stands in for KubeProxy, answering get_json from a fixed dict"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.paths = []
+
+    def get_json(self, path, timeout=3):
+        self.paths.append(path)
+        return self.responses.get(path)
+
+
+def make_game(responses):
+    """A K8sQuest with only the proxy set up - enough for declarative checks"""
+    game = K8sQuest.__new__(K8sQuest)
+    game._proxy = StubProxy(responses)
+    return game
+
+
+def test_lookup_field():
+    """Dotted paths walk dicts and list indexes, returning None when they miss"""
+    assert _lookup_field(POD, "status.phase") == "Running"
+    assert _lookup_field(POD, "status.containerStatuses.0.ready") is True
+    assert _lookup_field(POD, "status.containerStatuses.1.ready") is None
+    assert _lookup_field(POD, "status.containerStatuses.first") is None
+    assert _lookup_field(POD, "status.phase.length") is None
+    assert _lookup_field(POD, "spec.nodeName") is None
+
+
+def test_check_passes_and_fails_on_fields():
+    """Every expected field must match for the check to pass"""
+    path = "/api/v1/namespaces/k8squest/pods/nginx-broken"
+    game = make_game({path: POD})
+    check = {"kind": "Pod", "name": "nginx-broken", "expect": {"status.phase": "Running"}}
+
+    result = game._run_declarative_check(check)
+    assert result.returncode == 0
+    assert "✅ status.phase: Running" in result.stdout
+    assert game._proxy.paths == [path]
+
+    check["expect"]["status.containerStatuses.0.ready"] = False
+    result = game._run_declarative_check(check)
+    assert result.returncode == 1
+    assert "❌ status.containerStatuses.0.ready: True (expected False)" in result.stdout
+
+
+def test_check_missing_resource_fails():
+    """A 404 from the API ({} from the proxy) fails the check"""
+    game = make_game({"/api/v1/namespaces/k8squest/pods/nginx-broken": {}})
+    check = {"kind": "Pod", "name": "nginx-broken", "expect": {"status.phase": "Running"}}
+
+    result = game._run_declarative_check(check)
+    assert result.returncode == 1
+    assert "not found" in result.stdout
+
+
+def test_check_falls_back_when_api_unreachable():
+    """None from the proxy means validate.sh runs instead"""
+    game = make_game({})
+    check = {"kind": "Pod", "name": "nginx-broken", "expect": {"status.phase": "Running"}}
+    assert game._run_declarative_check(check) is None
+
+
+def test_malformed_checks_fall_back_to_validate_script():
+    """Blocks that can't be evaluated safely return None without querying the API"""
+    game = make_game({"/api/v1/namespaces/k8squest/pods/nginx-broken": POD})
+    malformed = [
+        "pod-running",
+        ["Pod", "nginx-broken"],
+        {"kind": "Pod", "name": "nginx-broken"},
+        {"kind": "Pod", "name": "nginx-broken", "expect": None},
+        {"kind": "Pod", "name": "nginx-broken", "expect": {}},
+        {"kind": "Pod", "name": "nginx-broken", "expect": ["status.phase"]},
+        {"kind": "Pod", "expect": {"status.phase": "Running"}},
+        {"kind": ["Pod"], "name": "nginx-broken", "expect": {"status.phase": "Running"}},
+        {"kind": "CronJob", "name": "nginx-broken", "expect": {"status.phase": "Running"}},
+    ]
+
+    for check in malformed:
+        assert game._run_declarative_check(check) is None, check
+    assert game._proxy.paths == []
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the K8sQuest level generator's mission.yaml writer
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.generate_level import create_level, dump_mission
+
+WORLDS_DIR = Path(__file__).parent.parent / "worlds"
+
+
+def test_dump_mission_round_trips_real_missions():
+    """Every shipped mission.yaml reads back unchanged after dump_mission"""
+    mission_files = sorted(WORLDS_DIR.glob("*/level-*/mission.yaml"))
+    assert mission_files
+
+    for mission_file in mission_files:
+        mission = yaml.safe_load(mission_file.read_text(encoding="utf-8"))
+        assert yaml.safe_load(dump_mission(mission)) == mission, mission_file
+
+
+def test_dump_mission_round_trips_edge_cases():
+    """Strings that look like other YAML types stay strings"""
+    mission = {
+        "name": "Fix: the 'broken' pod #1",
+        "description": "Line one\nLine two \"quoted\" \\ backslash",
+        "objective": "yes",
+        "xp": 100,
+        "difficulty": "null",
+        "expected_time": "10",
+        "concepts": ["true", "1.5", "- dash", "a: b", " padded ", "émoji 🚀", ""],
+        "ratio": 0.25,
+        "enabled": False,
+        "extra": None,
+        "empty": [],
+    }
+    assert yaml.safe_load(dump_mission(mission)) == mission
+
+
+def test_dump_mission_round_trips_special_floats():
+    """Exponent-form and non-finite floats read back as floats"""
+    mission = {"big": 1e20, "small": 1e-7, "inf": float("inf"), "nan": float("nan")}
+    loaded = yaml.safe_load(dump_mission(mission))
+
+    assert loaded["big"] == 1e20
+    assert loaded["small"] == 1e-7
+    assert loaded["inf"] == float("inf")
+    assert math.isnan(loaded["nan"])
+
+
+def test_create_level_strict_matches_fast_writer(tmp_path, monkeypatch):
+    """strict=True writes an equivalent mission.yaml through PyYAML"""
+    monkeypatch.chdir(tmp_path)
+    config = {
+        "name": "Test Level",
+        "description": "A level: for testing",
+        "objective": "Pass the tests",
+        "concepts": ["pods", "yes"],
+    }
+
+    fast_dir = create_level("world-test", 1, "fast", config)
+    strict_dir = create_level("world-test", 2, "strict", config, strict=True)
+
+    fast = yaml.safe_load((fast_dir / "mission.yaml").read_text(encoding="utf-8"))
+    strict = yaml.safe_load((strict_dir / "mission.yaml").read_text(encoding="utf-8"))
+    assert fast == strict
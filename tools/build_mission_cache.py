@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+K8sQuest Mission Cache Builder
+Precompiles every level's mission.yaml into a mission.json sidecar
+so the engine can load missions without parsing YAML
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def build_mission_cache(worlds_dir=Path("worlds")):
+    """Write mission.json next to each mission.yaml; returns (written, up_to_date)"""
+    written = up_to_date = 0
+
+    for mission_file in sorted(worlds_dir.glob("*/level-*/mission.yaml")):
+        cache_file = mission_file.with_name("mission.json")
+        if cache_file.exists() and cache_file.stat().st_mtime_ns >= mission_file.stat().st_mtime_ns:
+            up_to_date += 1
+            continue
+
+        with open(mission_file, encoding='utf-8') as f:
+            mission = yaml.load(f, Loader=Loader)
+
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(mission), encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+        written += 1
+
+    return written, up_to_date
+
+
+def main():
+    worlds_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("worlds")
+    if not worlds_dir.is_dir():
+        print(f"❌ Worlds directory not found: {worlds_dir}")
+        sys.exit(1)
+
+    written, up_to_date = build_mission_cache(worlds_dir)
+    print(f"✅ Mission cache: {written} built, {up_to_date} up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,62 @@ K8sQuest Level Generator
 Creates a complete level structure from a template
 """
 
-import sys
+import json
+import math
+import re
 import yaml
 from pathlib import Path
 
-def create_level(world, level_num, level_name, config):
-    """Create a complete level structure"""
+# Prefer the libyaml-backed C dumper; fall back to the pure-Python one
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Strings that can be written unquoted without YAML reading them as
+# something else (numbers, booleans, null, or flow/comment syntax)
+PLAIN_SCALAR = re.compile(r"[A-Za-z][A-Za-z0-9 _.()/-]*(?<! )")
+YAML_KEYWORDS = {"true", "false", "yes", "no", "on", "off", "y", "n", "null"}
+
+def yaml_scalar(value):
+    """Format a scalar for mission.yaml, quoting strings only when needed"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return repr(value)  # Only finite, non-exponent floats get here
+    if PLAIN_SCALAR.fullmatch(value) and value.lower() not in YAML_KEYWORDS:
+        return value
+    # JSON string escapes are a subset of YAML double-quoted escapes
+    return json.dumps(value, ensure_ascii=False)
+
+def dump_mission(mission):
+    """Serialize the flat mission dict (scalars plus a list of strings) as YAML
+
+    Falls back to PyYAML for any value outside that shape.
+    """
+    lines = []
+    for key, value in mission.items():
+        if isinstance(value, list):
+            if not all(isinstance(item, str) for item in value):
+                return yaml.dump(mission, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+            if not value:
+                lines.append(f"{key}: []")
+                continue
+            lines.append(f"{key}:")
+            lines.extend(f"- {yaml_scalar(item)}" for item in value)
+        elif isinstance(value, float) and (not math.isfinite(value) or "e" in repr(value)):
+            # repr() gives inf, nan and 1e+20, which YAML reads back as strings
+            return yaml.dump(mission, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+        elif isinstance(value, (str, int, float, bool)) or value is None:
+            lines.append(f"{key}: {yaml_scalar(value)}")
+        else:
+            return yaml.dump(mission, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+    return "\n".join(lines) + "\n"
+
+def create_level(world, level_num, level_name, config, strict=False):
+    """Create a complete level structure
+
+    strict=True writes mission.yaml through PyYAML instead of dump_mission.
+    """
     
     # Create level directory
     level_dir = Path(f"worlds/{world}/level-{level_num}-{level_name}")
@@ -26,12 +76,13 @@ def create_level(world, level_num, level_name, config):
         "concepts": config.get("concepts", [])
     }
     
-    with open(level_dir / "mission.yaml", 'w', encoding='utf-8') as f:
-        yaml.dump(mission, f, default_flow_style=False)
-    
-    # Create broken.yaml
-    with open(level_dir / "broken.yaml", 'w', encoding='utf-8') as f:
-        f.write(config.get("broken_yaml", "# Add broken resources here\n"))
+    # Collect every file's contents first, then write each in one call
+    files = [
+        (level_dir / "mission.yaml",
+         yaml.dump(mission, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+         if strict else dump_mission(mission)),
+        (level_dir / "broken.yaml", config.get("broken_yaml", "# Add broken resources here\n")),
+    ]
     
     # Create validate.sh
     validate_script = config.get("validate_script", """#!/bin/bash
@@ -39,12 +90,7 @@ def create_level(world, level_num, level_name, config):
 echo "✅ Validation passed"
 exit 0
 """)
-    
-    with open(level_dir / "validate.sh", 'w', encoding='utf-8') as f:
-        f.write(validate_script)
-    
-    # Make validate.sh executable
-    (level_dir / "validate.sh").chmod(0o755)
+    files.append((level_dir / "validate.sh", validate_script))
     
     # Create hints
     hints = config.get("hints", [
@@ -54,8 +100,7 @@ exit 0
     ])
     
     for i, hint in enumerate(hints[:3], 1):
-        with open(level_dir / f"hint-{i}.txt", 'w', encoding='utf-8') as f:
-            f.write(hint)
+        files.append((level_dir / f"hint-{i}.txt", hint))
     
     # Create debrief.md
     debrief = config.get("debrief", f"""# 🎓 Mission Debrief: {config['name']}
@@ -80,14 +125,18 @@ exit 0
 
 [List kubectl commands here]
 """)
-    
-    with open(level_dir / "debrief.md", 'w', encoding='utf-8') as f:
-        f.write(debrief)
+    files.append((level_dir / "debrief.md", debrief))
     
     # Create solution.yaml if provided
     if "solution_yaml" in config:
-        with open(level_dir / "solution.yaml", 'w', encoding='utf-8') as f:
-            f.write(config["solution_yaml"])
+        files.append((level_dir / "solution.yaml", config["solution_yaml"]))
+    
+    # Bytes are written as-is, so scripts keep LF line endings on every platform
+    for path, content in files:
+        path.write_bytes(content.encode("utf-8"))
+    
+    # Make validate.sh executable
+    (level_dir / "validate.sh").chmod(0o755)
     
     print(f"✅ Created: {level_dir}")
     return level_dir
@@ -96,3 +145,4 @@ if __name__ == "__main__":
     print("K8sQuest Level Generator")
     print("This tool helps create level structures quickly")
     print("Edit this script to add level configurations")
+    print("Pass strict=True to create_level to write mission.yaml through PyYAML instead")
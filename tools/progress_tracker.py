@@ -5,12 +5,21 @@ Displays completion status of all 50 levels
 """
 
 import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 
 console = Console()
 
+# orjson parses straight from bytes and is several times faster when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 WORLDS = {
     "world-1-basics": {
         "name": "World 1: Core Kubernetes Basics",
@@ -44,34 +53,74 @@ WORLDS = {
     }
 }
 
+# Progress bar cells; bars are sliced from these instead of rebuilt per world
+BAR_LENGTH = 40
+BAR_FULL = "█" * BAR_LENGTH
+BAR_EMPTY = "░" * BAR_LENGTH
+
+# Level number -> world directory, for bucketing completed levels
+WORLD_BY_LEVEL = {
+    num: world_dir for world_dir, world_info in WORLDS.items() for num in world_info["levels"]
+}
+
+def world_of(level_id):
+    """World a completed level belongs to: "level-12-..." by number, else its "world-..." prefix"""
+    if level_id.startswith("level-"):
+        num = level_id.split("-", 2)[1]
+        return WORLD_BY_LEVEL.get(int(num)) if num.isdigit() else None
+    return level_id.split("/", 1)[0]
+
+# Last parsed progress.json, keyed on (mtime_ns, size) so edits invalidate it
+PROGRESS_CACHE = {"key": None, "value": None}
+
 def load_progress():
     """Load progress from progress.json"""
     progress_file = Path("progress.json")
-    if progress_file.exists():
-        with open(progress_file, encoding='utf-8') as f:
-            return json.load(f)
-    return {"completed": [], "total_xp": 0}
+    try:
+        st = progress_file.stat()
+    except FileNotFoundError:
+        return {"completed": [], "total_xp": 0}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if PROGRESS_CACHE["key"] != key:
+        PROGRESS_CACHE["value"] = json_loads(progress_file.read_bytes())
+        PROGRESS_CACHE["key"] = key
+    return PROGRESS_CACHE["value"]
 
 def count_available_levels(world_dir):
     """Count how many levels exist in a world directory"""
-    world_path = Path("worlds") / world_dir
-    if not world_path.exists():
+    try:
+        entries = os.scandir(os.path.join("worlds", world_dir))
+    except FileNotFoundError:
         return 0
 
-    # Count directories with mission.yaml
-    count = 0
-    for item in world_path.iterdir():
-        if item.is_dir() and (item / "mission.yaml").exists():
-            count += 1
-    return count
+    # Count level-* directories with mission.yaml. The name test rules out
+    # stray entries for free and DirEntry.is_dir() needs no extra stat
+    with entries:
+        return sum(
+            1 for entry in entries
+            if entry.name.startswith("level-")
+            and entry.is_dir(follow_symlinks=False)
+            and os.path.isfile(os.path.join(entry.path, "mission.yaml"))
+        )
 
 def main():
     console.clear()
 
     progress = load_progress()
-    completed_levels = progress.get("completed", [])
+    # The engine saves "completed_levels"; older files used "completed". A set
+    # drops duplicate entries so a level is never counted twice
+    completed_levels = set(progress.get("completed_levels", progress.get("completed", [])))
     total_xp = progress.get("total_xp", 0)
 
+    # Scan each world directory once, concurrently (scandir releases the GIL),
+    # and reuse the counts below
+    with ThreadPoolExecutor(max_workers=len(WORLDS)) as executor:
+        counts = dict(zip(WORLDS, executor.map(count_available_levels, WORLDS)))
+
+    # Bucket completed levels by world in a single pass
+    completed_by_world = Counter(world_of(level) for level in completed_levels)
+
     # Header
     console.print(Panel.fit(
         "[bold cyan]🎮 K8sQuest - Progress Tracker[/bold cyan]\n"
@@ -85,14 +134,10 @@ def main():
     # World-by-world breakdown
     for world_dir, world_info in WORLDS.items():
         # Count available and completed levels
-        available_count = count_available_levels(world_dir)
+        available_count = counts[world_dir]
         total_levels = len(world_info["levels"])
 
-        # Count completed levels in this world
-        completed_in_world = sum(
-            1 for level in completed_levels
-            if level.startswith(world_dir)
-        )
+        completed_in_world = completed_by_world[world_dir]
 
         # Status icon
         if available_count == 0:
@@ -118,9 +163,8 @@ def main():
             console.print(f"   Available: {available_count}/{total_levels} levels | Completed: {completed_in_world}/{available_count}")
 
             # Visual progress bar
-            bar_length = 40
-            filled = int((completed_in_world / available_count) * bar_length)
-            bar = "█" * filled + "░" * (bar_length - filled)
+            filled = int((completed_in_world / available_count) * BAR_LENGTH)
+            bar = BAR_FULL[:filled] + BAR_EMPTY[:BAR_LENGTH - filled]
             console.print(f"   [{color}]{bar}[/{color}] {progress_pct:.0f}%")
         else:
             console.print(f"   Status: {status_text}")
@@ -128,7 +172,7 @@ def main():
     console.print()
 
     # Overall progress
-    total_available = sum(count_available_levels(w) for w in WORLDS.keys())
+    total_available = sum(counts.values())
     overall_pct = (len(completed_levels) / total_available) * 100 if total_available > 0 else 0
 
     console.print(Panel.fit(
@@ -142,7 +186,7 @@ def main():
     if total_available < 50:
         console.print("\n[yellow]📝 Next Steps:[/yellow]")
         for world_dir, world_info in WORLDS.items():
-            available = count_available_levels(world_dir)
+            available = counts[world_dir]
             total = len(world_info["levels"])
             if available < total:
                 remaining = total - available